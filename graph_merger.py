@@ -1,11 +1,44 @@
 import os
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 
-# Define paths
-INPUT_DIR = "input"
-OUTPUT_DIR = "output"
+from analyzer import (
+    INPUT_DIR,
+    OUTPUT_DIR,
+    PLOT_DPI,
+    downsample_for_plot,
+    ensure_directories,
+    read_csv_fast,
+)
+
+# Figure size shared by every comparison plot
+FIGURE_SIZE = (12, 8)
+
+# Reusable (figure, axes) pair, one per process; cleared between metrics
+# instead of rebuilding the whole figure/renderer stack each time
+_FIGURE_AXES = None
+
+
+def _get_axes():
+    """Return the shared (figure, axes) pair, creating it on first use."""
+    global _FIGURE_AXES
+    if _FIGURE_AXES is None:
+        # Deferred so non-plotting code paths skip pyplot's startup cost
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        fig = plt.figure(figsize=FIGURE_SIZE)
+        _FIGURE_AXES = (fig, fig.add_subplot())
+    return _FIGURE_AXES
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # Configure logging
 logging.basicConfig(
@@ -15,10 +48,78 @@ logging.basicConfig(
 )
 
 
-def ensure_directories():
-    """Ensure input and output directories exist."""
-    os.makedirs(INPUT_DIR, exist_ok=True)
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+if njit is not None:
+    # Compiled once (and cached on disk) at first call; the explicit loop
+    # avoids pandas' generic axis=1 reduction path on wide per-UE tables.
+    # Kept serial on purpose: the reduction is memory-bound, and a
+    # parallel=True kernel would spin up numba's threading layer, which
+    # leaves forked ProcessPoolExecutor workers (see compare_runs) in an
+    # invalid state and hangs the interpreter at shutdown.
+    @njit(fastmath=True, cache=True)
+    def _row_mean(values):
+        n_rows, n_cols = values.shape
+        out = np.empty(n_rows, dtype=np.float32)
+        for i in range(n_rows):
+            total = 0.0
+            for j in range(n_cols):
+                total += values[i, j]
+            out[i] = total / n_cols
+        return out
+else:
+    def _row_mean(values):
+        """NumPy fallback when numba is not installed."""
+        return values.mean(axis=1)
+
+
+def _load_one_run(run_number):
+    """Load and prepare one run's metrics CSV; returns None when unusable."""
+    run_dir = f"run{run_number}"
+    csv_path = os.path.join(INPUT_DIR, run_dir, "simulation_metrics.csv")
+    if not os.path.exists(csv_path):
+        logging.warning(f"{csv_path} not found. Skipping run{run_number}.")
+        return None
+
+    try:
+        required_columns = ["Time(s)", "Avg_Throughput(Kbps)", "Avg_Latency(ms)"]
+        # The selection and float32 pin are applied inside the parser on
+        # both the pandas and pyarrow paths, so the rest of the file's
+        # width is never materialized and the named columns skip inference
+        df = read_csv_fast(
+            csv_path,
+            usecols=lambda c: c in {"Time(s)", "Avg_Throughput(Kbps)", "Avg_Latency(ms)"} or "PacketLoss(%)" in c,
+            dtype={c: "float32" for c in required_columns},
+        )
+        # The named columns are already float32; downcast whatever
+        # remains (the per-UE PacketLoss columns) as well, since the
+        # row-mean below is memory-bound
+        float_cols = df.select_dtypes("float64").columns
+        if len(float_cols):
+            df[float_cols] = df[float_cols].astype("float32")
+        # Check required columns
+        missing_columns = [col for col in required_columns if col not in df.columns]
+        if missing_columns:
+            logging.warning(f"Missing columns {missing_columns} in {csv_path}. Skipping run{run_number}.")
+            return None
+
+        # Compute Avg_PacketLoss(%)
+        packet_loss_cols = [col for col in df.columns if "PacketLoss(%)" in col]
+        if packet_loss_cols:
+            df["Avg_PacketLoss(%)"] = _row_mean(df[packet_loss_cols].to_numpy(np.float32))
+            logging.info(f"Computed Avg_PacketLoss(%) for run{run_number}.")
+        else:
+            logging.warning(f"No PacketLoss(%) columns found in {csv_path}. Setting Avg_PacketLoss(%) to 0.")
+            df["Avg_PacketLoss(%)"] = 0
+
+        # Keep only required columns, tagged with the run number
+        result = (
+            df[["Time(s)", "Avg_Throughput(Kbps)", "Avg_Latency(ms)", "Avg_PacketLoss(%)"]]
+            .assign(Run=run_number)
+        )
+        logging.info(f"Loaded data for run{run_number}.")
+        return result
+    except Exception as e:
+        logging.error(f"Error loading {csv_path}: {e}")
+        return None
 
 
 def load_simulation_data(run_numbers):
@@ -29,39 +130,27 @@ def load_simulation_data(run_numbers):
         run_numbers (list of str): List of run numbers as strings.
 
     Returns:
-        dict: Dictionary mapping run numbers to their respective DataFrames.
+        DataFrame: Long-format data with one row per (Run, Time) pair and a
+        Run column, or None when no run could be loaded.
     """
-    data = {}
-    for run_number in run_numbers:
-        run_dir = f"run{run_number}"
-        csv_path = os.path.join(INPUT_DIR, run_dir, "simulation_metrics.csv")
-        if os.path.exists(csv_path):
-            try:
-                df = pd.read_csv(csv_path)
-                # Check required columns
-                required_columns = ["Time(s)", "Avg_Throughput(Kbps)", "Avg_Latency(ms)"]
-                missing_columns = [col for col in required_columns if col not in df.columns]
-                if missing_columns:
-                    logging.warning(f"Missing columns {missing_columns} in {csv_path}. Skipping run{run_number}.")
-                    continue
-
-                # Compute Avg_PacketLoss(%)
-                packet_loss_cols = [col for col in df.columns if "PacketLoss(%)" in col]
-                if packet_loss_cols:
-                    df["Avg_PacketLoss(%)"] = df[packet_loss_cols].mean(axis=1)
-                    logging.info(f"Computed Avg_PacketLoss(%) for run{run_number}.")
-                else:
-                    logging.warning(f"No PacketLoss(%) columns found in {csv_path}. Setting Avg_PacketLoss(%) to 0.")
-                    df["Avg_PacketLoss(%)"] = 0
-
-                # Keep only required columns
-                data[run_number] = df[["Time(s)", "Avg_Throughput(Kbps)", "Avg_Latency(ms)", "Avg_PacketLoss(%)"]]
-                logging.info(f"Loaded data for run{run_number}.")
-            except Exception as e:
-                logging.error(f"Error loading {csv_path}: {e}")
-        else:
-            logging.warning(f"{csv_path} not found. Skipping run{run_number}.")
-    return data
+    # The CSV parsers release the GIL while reading, so threads overlap the
+    # per-run I/O and parsing without any pickling; map preserves run order.
+    # These workers also run the numba kernel, so _row_mean must not start
+    # a native threading layer here: compare_runs forks a process pool
+    # right after this, and forking with TBB initialized hangs at exit
+    with ThreadPoolExecutor() as executor:
+        frames = [f for f in executor.map(_load_one_run, run_numbers) if f is not None]
+
+    # A single long-format frame keeps the per-run data columnar; consumers
+    # pivot on Run instead of looping over a dict of DataFrames
+    return pd.concat(frames, ignore_index=True) if frames else None
+
+
+def _warmup_worker():
+    """Warm matplotlib in pool workers so the first metric render is cheap."""
+    fig, ax = _get_axes()
+    ax.plot([0], [0])
+    ax.clear()
 
 
 def plot_metric(data, metric, output_file):
@@ -69,32 +158,38 @@ def plot_metric(data, metric, output_file):
     Plot the given metric for multiple runs.
 
     Parameters:
-        data (dict): Dictionary mapping run numbers to their DataFrames.
+        data (DataFrame): Long-format data with a Run column.
         metric (str): The metric column to plot.
         output_file (str): Path to save the generated plot.
     """
+    fig, ax = _get_axes()
     try:
-        plt.figure(figsize=(12, 8))
+        # Pivoting yields a 2-D (time x run) block that matplotlib draws
+        # with a single plot call instead of one call per run; duplicate
+        # timestamps within a run would make pivot raise, so keep the
+        # first sample per (Run, Time) pair as the per-run loop did
+        pivot = downsample_for_plot(
+            data.drop_duplicates(["Run", "Time(s)"]).pivot(
+                index="Time(s)", columns="Run", values=metric
+            )
+        )
 
-        # Define a list of markers and cycle through them
+        ax.clear()
+        lines = ax.plot(pivot.index.to_numpy(), pivot.to_numpy(), linestyle='-', markersize=5)
+
+        # Distinct markers per run, cycled as before
         markers = ['o', 's', '^', 'D', 'v', '>', '<', 'p', '*', 'h', 'H', 'X', 'd']
-        marker_cycle = (markers[i % len(markers)] for i in range(len(data)))
-
-        for (run_number, df), marker in zip(data.items(), marker_cycle):
-            plt.plot(df["Time(s)"], df[metric],
-                     label=f"Simulation {run_number}",
-                     marker=marker,
-                     linestyle='-',
-                     markersize=5)
-
-        plt.title(f"{metric} Comparison Across Runs", fontsize=16)
-        plt.xlabel("Time (s)", fontsize=14)
-        plt.ylabel(metric, fontsize=14)
-        plt.legend(title="Runs", fontsize=12)
-        plt.grid(True, which='both', linestyle='--', linewidth=0.5)
-        plt.tight_layout()
-        plt.savefig(output_file)
-        plt.close()
+        for i, line in enumerate(lines):
+            line.set_marker(markers[i % len(markers)])
+
+        ax.legend(lines, [f"Simulation {run}" for run in pivot.columns], title="Runs", fontsize=12)
+        ax.set_title(f"{metric} Comparison Across Runs", fontsize=16)
+        ax.set_xlabel("Time (s)", fontsize=14)
+        ax.set_ylabel(metric, fontsize=14)
+        ax.grid(True, which='both', linestyle='--', linewidth=0.5)
+        # tight_layout is skipped deliberately: it forces an extra renderer
+        # pass just to measure text extents
+        fig.savefig(output_file, dpi=PLOT_DPI)
         logging.info(f"Saved plot: {output_file}")
     except Exception as e:
         logging.error(f"Error plotting metric '{metric}': {e}")
@@ -111,7 +206,7 @@ def compare_runs(run_numbers, metrics=None, output_folder=None):
     """
     data = load_simulation_data(run_numbers)
 
-    if not data:
+    if data is None:
         logging.error("No valid data loaded. Exiting plotting function.")
         print("No valid data loaded. Please check the log for details.")
         return
@@ -124,10 +219,18 @@ def compare_runs(run_numbers, metrics=None, output_folder=None):
     output_folder = output_folder or os.path.join(OUTPUT_DIR, "comparison_plots")
     os.makedirs(output_folder, exist_ok=True)
 
-    # Generate comparative plots
-    for metric in metrics:
-        output_file = os.path.join(output_folder, f"{metric.replace('/', '_')}_comparison.png")
-        plot_metric(data, metric, output_file)
+    # Generate comparative plots; each metric renders independently, so the
+    # Agg rendering is fanned out across worker processes
+    output_files = [
+        os.path.join(output_folder, f"{metric.replace('/', '_')}_comparison.png")
+        for metric in metrics
+    ]
+    with ProcessPoolExecutor(
+        max_workers=min(len(metrics), os.cpu_count()), initializer=_warmup_worker
+    ) as executor:
+        # Consume the iterator so worker exceptions are re-raised here
+        for _ in executor.map(plot_metric, repeat(data), metrics, output_files):
+            pass
 
 
 def main():